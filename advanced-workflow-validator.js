@@ -38,31 +38,34 @@ class AdvancedWorkflowValidator {
     
     console.log(`🔍 Advanced validation for: ${workflow.name}`);
     
+    // Build the adjacency map and trigger list once and share them between
+    // all checks
+    const downstream = this.buildDownstreamMap(connections);
+    const triggers = this.findTriggerNodes(nodes);
+    
     // 1. Check for orphaned nodes
-    const orphanedNodes = this.findOrphanedNodes(nodes, connections);
+    const orphanedNodes = this.findOrphanedNodes(nodes, connections, downstream);
     if (orphanedNodes.length > 0) {
-      issues.push(`Found ${orphanedNodes.length} orphaned nodes: ${orphanedNodes.map(n => n.name).join(', ')}`);
+      issues.push(`Found ${orphanedNodes.length} orphaned nodes: ${this.summarizeNodeNames(orphanedNodes)}`);
     }
     
     // 2. Check for circular dependencies
-    const circularDeps = this.detectCircularDependencies(nodes, connections);
+    const circularDeps = this.detectCircularDependencies(nodes, connections, downstream);
     if (circularDeps.length > 0) {
       issues.push(`Circular dependencies detected: ${circularDeps.join(' → ')}`);
     }
     
     // 3. Check for unreachable nodes
-    const unreachableNodes = this.findUnreachableNodes(nodes, connections);
+    const unreachableNodes = this.findUnreachableNodes(nodes, connections, downstream, triggers);
     if (unreachableNodes.length > 0) {
-      issues.push(`Unreachable nodes: ${unreachableNodes.map(n => n.name).join(', ')}`);
+      issues.push(`Unreachable nodes: ${this.summarizeNodeNames(unreachableNodes)}`);
     }
     
     // 4. Validate data flow
-    const dataFlowIssues = this.validateDataFlow(nodes, connections);
-    issues.push(...dataFlowIssues);
+    this.validateDataFlow(nodes, connections, downstream, issues);
     
     // 5. Check for missing trigger
-    const triggerIssues = this.validateTriggers(nodes);
-    issues.push(...triggerIssues);
+    this.validateTriggers(nodes, issues, triggers);
     
     return {
       isValid: issues.length === 0,
@@ -73,27 +76,58 @@ class AdvancedWorkflowValidator {
     };
   }
 
+  /**
+   * Comma-separated names of the first `limit` nodes plus a "(+N more)" tail;
+   * the full lists stay available on the validation result
+   */
+  summarizeNodeNames(nodes, limit = 10) {
+    const names = nodes.slice(0, limit).map(n => n.name).join(', ');
+    const extra = nodes.length - limit;
+    return extra > 0 ? `${names} (+${extra} more)` : names;
+  }
+
+  /**
+   * Build a map of source node name -> direct downstream node names, one
+   * entry per connection so repeated edges are still reported per edge
+   */
+  buildDownstreamMap(connections) {
+    const downstream = new Map();
+    
+    for (const [sourceName, nodeConnections] of Object.entries(connections)) {
+      const targets = [];
+      if (nodeConnections && nodeConnections.main) {
+        for (const connectionGroup of nodeConnections.main) {
+          for (const connection of connectionGroup) {
+            targets.push(connection.node);
+          }
+        }
+      }
+      downstream.set(sourceName, targets);
+    }
+    
+    return downstream;
+  }
+
+  /**
+   * Find trigger nodes in workflow order
+   */
+  findTriggerNodes(nodes) {
+    return nodes.filter(node => 
+      this.nodeTypes.triggers.includes(node.type)
+    );
+  }
+
   /**
    * Find nodes that have no connections (input or output)
    */
-  findOrphanedNodes(nodes, connections) {
-    const connectedNodes = new Set();
-    
-    // Add all nodes that have outgoing connections
-    Object.keys(connections).forEach(nodeName => {
-      connectedNodes.add(nodeName);
-    });
-    
-    // Add all nodes that have incoming connections
-    Object.values(connections).forEach(nodeConnections => {
-      if (nodeConnections.main) {
-        nodeConnections.main.forEach(connectionGroup => {
-          connectionGroup.forEach(connection => {
-            connectedNodes.add(connection.node);
-          });
-        });
+  findOrphanedNodes(nodes, connections, downstream = this.buildDownstreamMap(connections)) {
+    // Nodes with outgoing connections plus every node they point to
+    const connectedNodes = new Set(downstream.keys());
+    for (const targets of downstream.values()) {
+      for (const target of targets) {
+        connectedNodes.add(target);
       }
-    });
+    }
     
     // Find nodes not in connected set
     return nodes.filter(node => !connectedNodes.has(node.name));
@@ -102,7 +136,7 @@ class AdvancedWorkflowValidator {
   /**
    * Detect circular dependencies in workflow
    */
-  detectCircularDependencies(nodes, connections) {
+  detectCircularDependencies(nodes, connections, downstream = this.buildDownstreamMap(connections)) {
     const visited = new Set();
     const recursionStack = new Set();
     const path = [];
@@ -122,13 +156,11 @@ class AdvancedWorkflowValidator {
       recursionStack.add(nodeName);
       path.push(nodeName);
       
-      const nodeConnections = connections[nodeName];
-      if (nodeConnections && nodeConnections.main) {
-        for (const connectionGroup of nodeConnections.main) {
-          for (const connection of connectionGroup) {
-            const cycle = hasCycle(connection.node);
-            if (cycle) return cycle;
-          }
+      const targets = downstream.get(nodeName);
+      if (targets) {
+        for (const target of targets) {
+          const cycle = hasCycle(target);
+          if (cycle) return cycle;
         }
       }
       
@@ -151,57 +183,55 @@ class AdvancedWorkflowValidator {
   /**
    * Find nodes that cannot be reached from any trigger
    */
-  findUnreachableNodes(nodes, connections) {
-    const triggers = nodes.filter(node => 
-      this.nodeTypes.triggers.includes(node.type)
-    );
-    
+  findUnreachableNodes(
+    nodes,
+    connections,
+    downstream = this.buildDownstreamMap(connections),
+    triggers = this.findTriggerNodes(nodes)
+  ) {
     if (triggers.length === 0) return nodes; // No triggers, all unreachable
     
     const reachable = new Set();
     
-    const traverse = (nodeName) => {
-      if (reachable.has(nodeName)) return;
+    // Iterative DFS from all triggers; avoids deep recursion on long chains
+    const stack = triggers.map(trigger => trigger.name);
+    while (stack.length > 0) {
+      const nodeName = stack.pop();
+      if (reachable.has(nodeName)) continue;
       reachable.add(nodeName);
       
-      const nodeConnections = connections[nodeName];
-      if (nodeConnections && nodeConnections.main) {
-        for (const connectionGroup of nodeConnections.main) {
-          for (const connection of connectionGroup) {
-            traverse(connection.node);
-          }
+      const targets = downstream.get(nodeName);
+      if (targets) {
+        for (const target of targets) {
+          if (!reachable.has(target)) stack.push(target);
         }
       }
-    };
-    
-    // Start traversal from all triggers
-    triggers.forEach(trigger => traverse(trigger.name));
+    }
     
     return nodes.filter(node => !reachable.has(node.name));
   }
 
   /**
-   * Validate data flow between nodes
+   * Validate data flow between nodes, appending to `issues` if provided
    */
-  validateDataFlow(nodes, connections) {
-    const issues = [];
+  validateDataFlow(nodes, connections, downstream = this.buildDownstreamMap(connections), issues = []) {
+    const nodesByName = new Map();
+    for (const node of nodes) {
+      if (!nodesByName.has(node.name)) nodesByName.set(node.name, node);
+    }
     
-    for (const [sourceName, nodeConnections] of Object.entries(connections)) {
-      const sourceNode = nodes.find(n => n.name === sourceName);
+    for (const [sourceName, targets] of downstream) {
+      const sourceNode = nodesByName.get(sourceName);
       if (!sourceNode) continue;
       
-      if (nodeConnections.main) {
-        for (const connectionGroup of nodeConnections.main) {
-          for (const connection of connectionGroup) {
-            const targetNode = nodes.find(n => n.name === connection.node);
-            if (!targetNode) continue;
-            
-            // Check if connection makes logical sense
-            const flowIssue = this.validateNodeConnection(sourceNode, targetNode);
-            if (flowIssue) {
-              issues.push(`Data flow issue: ${sourceName} → ${connection.node}: ${flowIssue}`);
-            }
-          }
+      for (const targetName of targets) {
+        const targetNode = nodesByName.get(targetName);
+        if (!targetNode) continue;
+        
+        // Check if connection makes logical sense
+        const flowIssue = this.validateNodeConnection(sourceNode, targetNode);
+        if (flowIssue) {
+          issues.push(`Data flow issue: ${sourceName} → ${targetName}: ${flowIssue}`);
         }
       }
     }
@@ -228,14 +258,9 @@ class AdvancedWorkflowValidator {
   }
 
   /**
-   * Validate trigger nodes
+   * Validate trigger nodes, appending to `issues` if provided
    */
-  validateTriggers(nodes) {
-    const issues = [];
-    const triggers = nodes.filter(node => 
-      this.nodeTypes.triggers.includes(node.type)
-    );
-    
+  validateTriggers(nodes, issues = [], triggers = this.findTriggerNodes(nodes)) {
     if (triggers.length === 0) {
       issues.push('Workflow has no trigger nodes');
     } else if (triggers.length > 3) {
@@ -275,9 +300,7 @@ class AdvancedWorkflowValidator {
     }
     
     // 3. Add missing trigger if needed
-    const triggers = workflow.nodes.filter(node => 
-      this.nodeTypes.triggers.includes(node.type)
-    );
+    const triggers = this.findTriggerNodes(workflow.nodes);
     if (triggers.length === 0) {
       const fixResult = this.addMissingTrigger(workflow);
       if (fixResult.fixed) {
@@ -296,9 +319,7 @@ class AdvancedWorkflowValidator {
     const fixes = [];
     let fixed = false;
     
-    const triggers = workflow.nodes.filter(node => 
-      this.nodeTypes.triggers.includes(node.type)
-    );
+    const triggers = this.findTriggerNodes(workflow.nodes);
     
     if (triggers.length === 0) return { fixed, fixes };
     
@@ -340,9 +361,7 @@ class AdvancedWorkflowValidator {
     const fixes = [];
     let fixed = false;
     
-    const triggers = workflow.nodes.filter(node => 
-      this.nodeTypes.triggers.includes(node.type)
-    );
+    const triggers = this.findTriggerNodes(workflow.nodes);
     
     if (triggers.length === 0) return { fixed, fixes };
     
@@ -2,6 +2,9 @@
 const crypto = require('crypto');
 const { ProactiveErrorPrevention } = require('../proactive-error-prevention.js');
 
+// Validation keeps no per-workflow state, so one instance serves every request
+const errorPrevention = new ProactiveErrorPrevention();
+
 // Helper function to safely parse request body
 function getRequestBody(req) {
   try {
@@ -198,68 +201,155 @@ const WORKFLOW_PATTERNS = {
   }
 };
 
+// Aho-Corasick automaton over a keyword list. The returned matcher walks the
+// text once and reports every keyword it contains, instead of running one
+// substring scan per keyword.
+function buildKeywordMatcher(keywords) {
+  const transitions = [new Map()];
+  const failure = [0];
+  const outputs = [[]];
+  
+  for (const keyword of keywords) {
+    let state = 0;
+    for (const char of keyword) {
+      let next = transitions[state].get(char);
+      if (next === undefined) {
+        next = transitions.length;
+        transitions.push(new Map());
+        failure.push(0);
+        outputs.push([]);
+        transitions[state].set(char, next);
+      }
+      state = next;
+    }
+    outputs[state].push(keyword);
+  }
+  
+  // Breadth-first pass to link each state to its longest proper suffix state
+  const queue = [...transitions[0].values()];
+  for (let head = 0; head < queue.length; head++) {
+    const state = queue[head];
+    for (const [char, next] of transitions[state]) {
+      let fallback = failure[state];
+      while (fallback !== 0 && !transitions[fallback].has(char)) {
+        fallback = failure[fallback];
+      }
+      failure[next] = transitions[fallback].get(char) ?? 0;
+      outputs[next] = outputs[next].concat(outputs[failure[next]]);
+      queue.push(next);
+    }
+  }
+  
+  return function findKeywords(text) {
+    const found = new Set();
+    let state = 0;
+    for (const char of text) {
+      while (state !== 0 && !transitions[state].has(char)) {
+        state = failure[state];
+      }
+      state = transitions[state].get(char) ?? 0;
+      for (const keyword of outputs[state]) {
+        found.add(keyword);
+      }
+    }
+    return found;
+  };
+}
+
+// Detection tables are static, so they are built once at load rather than
+// on every analyzeDescription() call
+const TRIGGER_PATTERNS = Object.freeze([
+  { pattern: /every \d+ (minute|hour|day|week)/i, service: 'schedule' },
+  { pattern: /(monitor|check|watch|poll)/i, service: 'schedule' },
+  { pattern: /(webhook|incoming|receive)/i, service: 'webhook' },
+  { pattern: /when.*?(new|created|added|received)/i, service: 'webhook' }
+]);
+
+// `service` may be a function of the lowercased description when the match
+// alone does not decide which node to use
+const ACTION_PATTERNS = Object.freeze([
+  { pattern: /(slack.*?(message|notification|alert))/i, service: 'slack' },
+  { pattern: /(telegram.*?(alert|message|notification))/i, service: 'telegram' },
+  { pattern: /(github.*?(issue|repository|deploy))/i, service: 'github' },
+  { pattern: /(google ads|ads.*?lead)/i, service: 'google_ads' },
+  { pattern: /(notion.*?(database|page))/i, service: 'notion' },
+  { pattern: /(airtable.*?(record|database))/i, service: 'airtable' },
+  { pattern: /(discord.*?message)/i, service: 'discord' },
+  { pattern: /(paypal.*?transaction)/i, service: 'paypal' },
+  { pattern: /(quickbooks.*?invoice)/i, service: 'quickbooks' },
+  { pattern: /(mongodb|mysql).*?(database|store)/i, service: desc => (desc.includes('mongodb') ? 'mongodb' : 'mysql') },
+  { pattern: /(api|endpoint|http|request)/i, service: 'http_request' },
+  { pattern: /(if|condition|check|exceeds|greater|less)/i, service: 'if' },
+  { pattern: /(process|transform|code|logic)/i, service: 'code' }
+]);
+
+// Plain keyword fallbacks for services the regex patterns above can miss
+const ADDITIONAL_SERVICE_KEYWORDS = Object.freeze([
+  { keywords: ['google ads', 'ads'], service: 'google_ads' },
+  { keywords: ['notion', 'crm'], service: 'notion' },
+  { keywords: ['airtable'], service: 'airtable' },
+  { keywords: ['telegram'], service: 'telegram' },
+  { keywords: ['github'], service: 'github' },
+  { keywords: ['discord'], service: 'discord' },
+  { keywords: ['paypal'], service: 'paypal' },
+  { keywords: ['quickbooks'], service: 'quickbooks' },
+  { keywords: ['mongodb'], service: 'mongodb' },
+  { keywords: ['mysql'], service: 'mysql' }
+]);
+
+const findPatternKeywords = buildKeywordMatcher(new Set([
+  ...Object.values(WORKFLOW_PATTERNS).flatMap(config => config.keywords),
+  ...ADDITIONAL_SERVICE_KEYWORDS.flatMap(entry => entry.keywords)
+]));
+
 function generateNodeId() {
   return crypto.randomBytes(8).toString('hex');
 }
 
-function analyzeDescription(description) {
-  const desc = description.toLowerCase();
+// Callers pass the description already lowercased (`desc`), so it is
+// case-folded once per request rather than once per helper
+function analyzeDescription(desc) {
   const detectedServices = [];
+  // Mirrors detectedServices for O(1) "already detected" checks
+  const detectedNames = new Set();
   const triggers = [];
   const actions = [];
   
-  // Detect services mentioned in description
+  // Detect services mentioned in description; a service is credited with the
+  // first of its keywords (in pattern order) that appears anywhere in the text
+  const foundKeywords = findPatternKeywords(desc);
   for (const [service, config] of Object.entries(WORKFLOW_PATTERNS)) {
     for (const keyword of config.keywords) {
-      if (desc.includes(keyword)) {
+      if (foundKeywords.has(keyword)) {
         detectedServices.push({ service, config, keyword });
+        detectedNames.add(service);
         break;
       }
     }
   }
   
   // Enhanced trigger detection
-  const triggerPatterns = [
-    { pattern: /every \d+ (minute|hour|day|week)/i, service: 'schedule' },
-    { pattern: /(monitor|check|watch|poll)/i, service: 'schedule' },
-    { pattern: /(webhook|incoming|receive)/i, service: 'webhook' },
-    { pattern: /when.*?(new|created|added|received)/i, service: 'webhook' }
-  ];
-  
-  for (const { pattern, service } of triggerPatterns) {
-    if (pattern.test(desc) && !detectedServices.some(s => s.service === service)) {
+  for (const { pattern, service } of TRIGGER_PATTERNS) {
+    if (pattern.test(desc) && !detectedNames.has(service)) {
       const config = WORKFLOW_PATTERNS[service];
       if (config) {
         const triggerService = { service, config, keyword: service };
         detectedServices.push(triggerService);
+        detectedNames.add(service);
         triggers.push(triggerService);
       }
     }
   }
   
   // Enhanced action detection with more specific patterns
-  const actionPatterns = [
-    { pattern: /(slack.*?(message|notification|alert))/i, service: 'slack' },
-    { pattern: /(telegram.*?(alert|message|notification))/i, service: 'telegram' },
-    { pattern: /(github.*?(issue|repository|deploy))/i, service: 'github' },
-    { pattern: /(google ads|ads.*?lead)/i, service: 'google_ads' },
-    { pattern: /(notion.*?(database|page))/i, service: 'notion' },
-    { pattern: /(airtable.*?(record|database))/i, service: 'airtable' },
-    { pattern: /(discord.*?message)/i, service: 'discord' },
-    { pattern: /(paypal.*?transaction)/i, service: 'paypal' },
-    { pattern: /(quickbooks.*?invoice)/i, service: 'quickbooks' },
-    { pattern: /(mongodb|mysql).*?(database|store)/i, service: desc.includes('mongodb') ? 'mongodb' : 'mysql' },
-    { pattern: /(api|endpoint|http|request)/i, service: 'http_request' },
-    { pattern: /(if|condition|check|exceeds|greater|less)/i, service: 'if' },
-    { pattern: /(process|transform|code|logic)/i, service: 'code' }
-  ];
-  
-  for (const { pattern, service } of actionPatterns) {
-    if (pattern.test(desc) && !detectedServices.some(s => s.service === service)) {
+  for (const { pattern, service: serviceOrResolver } of ACTION_PATTERNS) {
+    const service = typeof serviceOrResolver === 'function' ? serviceOrResolver(desc) : serviceOrResolver;
+    if (pattern.test(desc) && !detectedNames.has(service)) {
       const config = WORKFLOW_PATTERNS[service];
       if (config) {
         const actionService = { service, config, keyword: service };
         detectedServices.push(actionService);
+        detectedNames.add(service);
         if (!triggers.includes(actionService)) {
           actions.push(actionService);
         }
@@ -273,30 +363,19 @@ function analyzeDescription(description) {
     const config = WORKFLOW_PATTERNS[defaultTrigger];
     const triggerService = { service: defaultTrigger, config, keyword: defaultTrigger };
     detectedServices.push(triggerService);
+    detectedNames.add(defaultTrigger);
     triggers.push(triggerService);
   }
   
   // Enhanced fallback: detect services from description even if not in patterns
-  const additionalServiceDetection = [
-    { keywords: ['google ads', 'ads'], service: 'google_ads' },
-    { keywords: ['notion', 'crm'], service: 'notion' },
-    { keywords: ['airtable'], service: 'airtable' },
-    { keywords: ['telegram'], service: 'telegram' },
-    { keywords: ['github'], service: 'github' },
-    { keywords: ['discord'], service: 'discord' },
-    { keywords: ['paypal'], service: 'paypal' },
-    { keywords: ['quickbooks'], service: 'quickbooks' },
-    { keywords: ['mongodb'], service: 'mongodb' },
-    { keywords: ['mysql'], service: 'mysql' }
-  ];
-
-  for (const { keywords, service } of additionalServiceDetection) {
-    if (keywords.some(keyword => desc.includes(keyword)) && 
-        !detectedServices.some(s => s.service === service)) {
+  for (const { keywords, service } of ADDITIONAL_SERVICE_KEYWORDS) {
+    if (keywords.some(keyword => foundKeywords.has(keyword)) && 
+        !detectedNames.has(service)) {
       const config = WORKFLOW_PATTERNS[service];
       if (config) {
         const serviceObj = { service, config, keyword: service };
         detectedServices.push(serviceObj);
+        detectedNames.add(service);
         actions.push(serviceObj);
       }
     }
@@ -308,15 +387,49 @@ function analyzeDescription(description) {
     const config = WORKFLOW_PATTERNS[defaultAction];
     const actionService = { service: defaultAction, config, keyword: defaultAction };
     detectedServices.push(actionService);
+    detectedNames.add(defaultAction);
     actions.push(actionService);
   }
   
   return { detectedServices, triggers, actions };
 }
 
-function createTriggerNode(service, description) {
+// Bounded LRU of analyzeDescription() results keyed by the lowercased
+// description, so warm instances skip detection for repeated prompts.
+// Results are shared between requests, so they are frozen. Long prompts are
+// rarely repeated verbatim and would pin large keys, so they bypass the cache.
+const ANALYSIS_CACHE_SIZE = 256;
+const ANALYSIS_CACHE_MAX_KEY_LENGTH = 512;
+const analysisCache = new Map();
+
+function analyzeDescriptionCached(desc) {
+  if (desc.length > ANALYSIS_CACHE_MAX_KEY_LENGTH) {
+    return analyzeDescription(desc);
+  }
+  
+  const cached = analysisCache.get(desc);
+  if (cached) {
+    analysisCache.delete(desc);
+    analysisCache.set(desc, cached);
+    return cached;
+  }
+  
+  const analysis = analyzeDescription(desc);
+  for (const services of Object.values(analysis)) {
+    services.forEach(Object.freeze);
+    Object.freeze(services);
+  }
+  Object.freeze(analysis);
+  
+  analysisCache.set(desc, analysis);
+  if (analysisCache.size > ANALYSIS_CACHE_SIZE) {
+    analysisCache.delete(analysisCache.keys().next().value);
+  }
+  return analysis;
+}
+
+function createTriggerNode(service, desc) {
   const nodeId = generateNodeId();
-  const desc = description.toLowerCase();
   
   const triggerConfigs = {
     'schedule': {
@@ -352,35 +465,8 @@ function createTriggerNode(service, description) {
   };
 }
 
-function createActionNode(service, description, index) {
-  const nodeId = generateNodeId();
-  const desc = description.toLowerCase();
-  
-  const actionConfigs = {
-    'http_request': {
-      parameters: {
-        method: 'GET',
-        url: desc.includes('monitor') ? 'https://api.example.com/health' : 'https://api.example.com/endpoint',
-        options: { timeout: 5000 }
-      },
-      name: desc.includes('monitor') ? 'Monitor API Endpoint' : 'HTTP Request'
-    },
-    'if': {
-      parameters: {
-        conditions: {
-          number: [{
-            value1: '={{ $json.response_time }}',
-            operation: 'larger',
-            value2: desc.includes('2 seconds') ? 2000 : 1000
-          }]
-        }
-      },
-      name: desc.includes('response time') ? 'Check Response Time' : 'Condition Check'
-    },
-    'code': {
-      parameters: {
-        jsCode: desc.includes('monitor') ? 
-          `// Monitor API response time
+// Code node bodies used by the action builders below
+const MONITOR_RESPONSE_TIME_CODE = `// Monitor API response time
 const startTime = Date.now();
 const response = $input.all();
 const responseTime = Date.now() - startTime;
@@ -392,8 +478,9 @@ return [{
     status: responseTime > 2000 ? 'slow' : 'ok',
     timestamp: new Date().toISOString()
   }
-}];` :
-          `// Process workflow data
+}];`;
+
+const PROCESS_DATA_CODE = `// Process workflow data
 const inputData = $input.all();
 const processedData = inputData.map(item => ({
   ...item.json,
@@ -401,241 +488,272 @@ const processedData = inputData.map(item => ({
   timestamp: new Date().toISOString()
 }));
 
-return processedData;`,
+return processedData;`;
 
-      },
-      name: desc.includes('monitor') ? 'Process Response Time' : 'Process Data'
+// Action node builders keyed by service. Each takes the lowercased description
+// and returns a fresh { parameters, name }; createActionNode() only builds the
+// one it needs instead of constructing every service's config per call.
+const ACTION_NODE_CONFIGS = {
+  'http_request': desc => ({
+    parameters: {
+      method: 'GET',
+      url: desc.includes('monitor') ? 'https://api.example.com/health' : 'https://api.example.com/endpoint',
+      options: { timeout: 5000 }
     },
-    'slack': {
-      parameters: {
-        channel: '#alerts',
-        text: desc.includes('alert') ? 
-          'Alert: {{ $json.message || "API response time exceeded threshold" }}' :
-          'New notification from workflow',
-        username: 'n8n-bot'
-      },
-      name: desc.includes('alert') ? 'Send Alert' : 'Send Slack Message'
+    name: desc.includes('monitor') ? 'Monitor API Endpoint' : 'HTTP Request'
+  }),
+  'if': desc => ({
+    parameters: {
+      conditions: {
+        number: [{
+          value1: '={{ $json.response_time }}',
+          operation: 'larger',
+          value2: desc.includes('2 seconds') ? 2000 : 1000
+        }]
+      }
     },
-    'gmail': {
-      parameters: {
-        operation: 'send',
-        subject: 'Automated Email',
-        toEmail: 'recipient@example.com',
-        message: 'This is an automated message from your workflow.'
-      },
-      name: 'Send Email'
+    name: desc.includes('response time') ? 'Check Response Time' : 'Condition Check'
+  }),
+  'code': desc => ({
+    parameters: {
+      jsCode: desc.includes('monitor') ? MONITOR_RESPONSE_TIME_CODE : PROCESS_DATA_CODE
     },
-    'trello': {
-      parameters: {
-        operation: 'create',
-        boardId: 'your-board-id',
-        listId: 'your-list-id',
-        name: 'New Task from Workflow',
-        description: 'Created automatically by n8n workflow'
-      },
-      name: 'Create Trello Card'
+    name: desc.includes('monitor') ? 'Process Response Time' : 'Process Data'
+  }),
+  'slack': desc => ({
+    parameters: {
+      channel: '#alerts',
+      text: desc.includes('alert') ? 
+        'Alert: {{ $json.message || "API response time exceeded threshold" }}' :
+        'New notification from workflow',
+      username: 'n8n-bot'
     },
-    'shopify': {
-      parameters: {
-        operation: 'get',
-        resource: 'order'
-      },
-      name: 'Get Shopify Order'
+    name: desc.includes('alert') ? 'Send Alert' : 'Send Slack Message'
+  }),
+  'gmail': () => ({
+    parameters: {
+      operation: 'send',
+      subject: 'Automated Email',
+      toEmail: 'recipient@example.com',
+      message: 'This is an automated message from your workflow.'
     },
-    'airtable': {
-      parameters: {
-        operation: 'create',
-        baseId: 'your-base-id',
-        tableId: 'your-table-id',
-        fields: {
-          'Name': 'New Record'
-        }
-      },
-      name: 'Create Airtable Record'
+    name: 'Send Email'
+  }),
+  'trello': () => ({
+    parameters: {
+      operation: 'create',
+      boardId: 'your-board-id',
+      listId: 'your-list-id',
+      name: 'New Task from Workflow',
+      description: 'Created automatically by n8n workflow'
     },
-    'notion': {
-      parameters: {
-        operation: 'create',
-        databaseId: 'your-database-id',
-        properties: {
-          'Name': {
-            title: [{ text: { content: 'New Entry' } }]
-          }
+    name: 'Create Trello Card'
+  }),
+  'shopify': () => ({
+    parameters: {
+      operation: 'get',
+      resource: 'order'
+    },
+    name: 'Get Shopify Order'
+  }),
+  'airtable': () => ({
+    parameters: {
+      operation: 'create',
+      baseId: 'your-base-id',
+      tableId: 'your-table-id',
+      fields: {
+        'Name': 'New Record'
+      }
+    },
+    name: 'Create Airtable Record'
+  }),
+  'notion': () => ({
+    parameters: {
+      operation: 'create',
+      databaseId: 'your-database-id',
+      properties: {
+        'Name': {
+          title: [{ text: { content: 'New Entry' } }]
         }
-      },
-      name: 'Create Notion Page'
+      }
     },
-    'google_sheets': {
-      parameters: {
-        operation: 'append',
-        sheetId: 'your-sheet-id',
-        range: 'A:Z',
-        values: [['New', 'Data', 'Row']]
-      },
-      name: 'Add to Google Sheets'
+    name: 'Create Notion Page'
+  }),
+  'google_sheets': () => ({
+    parameters: {
+      operation: 'append',
+      sheetId: 'your-sheet-id',
+      range: 'A:Z',
+      values: [['New', 'Data', 'Row']]
     },
-    'telegram': {
-      parameters: {
-        chatId: 'your-chat-id',
-        text: desc.includes('alert') ? 
-          'Alert: {{ $json.message || "Notification from workflow" }}' :
-          'Notification from workflow'
-      },
-      name: desc.includes('alert') ? 'Send Telegram Alert' : 'Send Telegram Message'
+    name: 'Add to Google Sheets'
+  }),
+  'telegram': desc => ({
+    parameters: {
+      chatId: 'your-chat-id',
+      text: desc.includes('alert') ? 
+        'Alert: {{ $json.message || "Notification from workflow" }}' :
+        'Notification from workflow'
     },
-    'github': {
-      parameters: {
-        operation: desc.includes('issue') ? 'createIssue' : 'get',
-        repository: 'your-repo',
-        title: desc.includes('issue') ? 'New Issue from Workflow' : undefined,
-        body: desc.includes('issue') ? 'This issue was created automatically' : undefined
-      },
-      name: desc.includes('issue') ? 'Create GitHub Issue' : 'GitHub Action'
+    name: desc.includes('alert') ? 'Send Telegram Alert' : 'Send Telegram Message'
+  }),
+  'github': desc => ({
+    parameters: {
+      operation: desc.includes('issue') ? 'createIssue' : 'get',
+      repository: 'your-repo',
+      title: desc.includes('issue') ? 'New Issue from Workflow' : undefined,
+      body: desc.includes('issue') ? 'This issue was created automatically' : undefined
     },
-    'google_ads': {
-      parameters: {
-        operation: 'getAll',
-        resource: 'lead'
-      },
-      name: 'Get Google Ads Leads'
+    name: desc.includes('issue') ? 'Create GitHub Issue' : 'GitHub Action'
+  }),
+  'google_ads': () => ({
+    parameters: {
+      operation: 'getAll',
+      resource: 'lead'
     },
-    'discord': {
-      parameters: {
-        operation: 'sendMessage',
-        channelId: 'your-channel-id',
-        content: 'Notification from workflow'
-      },
-      name: 'Send Discord Message'
+    name: 'Get Google Ads Leads'
+  }),
+  'discord': () => ({
+    parameters: {
+      operation: 'sendMessage',
+      channelId: 'your-channel-id',
+      content: 'Notification from workflow'
     },
-    'paypal': {
-      parameters: {
-        operation: 'getAll',
-        resource: 'payment'
-      },
-      name: 'Get PayPal Transactions'
+    name: 'Send Discord Message'
+  }),
+  'paypal': () => ({
+    parameters: {
+      operation: 'getAll',
+      resource: 'payment'
     },
-    'quickbooks': {
-      parameters: {
-        operation: 'create',
-        resource: 'invoice',
-        customerRef: 'customer-id'
-      },
-      name: 'Create QuickBooks Invoice'
+    name: 'Get PayPal Transactions'
+  }),
+  'quickbooks': () => ({
+    parameters: {
+      operation: 'create',
+      resource: 'invoice',
+      customerRef: 'customer-id'
     },
-    'mongodb': {
-      parameters: {
-        operation: 'insert',
-        collection: 'data',
-        fields: 'json'
-      },
-      name: 'Insert to MongoDB'
+    name: 'Create QuickBooks Invoice'
+  }),
+  'mongodb': () => ({
+    parameters: {
+      operation: 'insert',
+      collection: 'data',
+      fields: 'json'
     },
-    'mysql': {
-      parameters: {
-        operation: 'insert',
-        table: 'data'
-      },
-      name: 'Insert to MySQL'
+    name: 'Insert to MongoDB'
+  }),
+  'mysql': () => ({
+    parameters: {
+      operation: 'insert',
+      table: 'data'
     },
-    'microsoft_teams': {
-      parameters: {
-        operation: 'postMessage',
-        channelId: 'your-channel-id',
-        message: 'Notification from workflow'
-      },
-      name: 'Send Teams Message'
+    name: 'Insert to MySQL'
+  }),
+  'microsoft_teams': () => ({
+    parameters: {
+      operation: 'postMessage',
+      channelId: 'your-channel-id',
+      message: 'Notification from workflow'
     },
-    'whatsapp': {
-      parameters: {
-        operation: 'sendMessage',
-        to: 'your-phone-number',
-        message: 'Notification from workflow'
-      },
-      name: 'Send WhatsApp Message'
+    name: 'Send Teams Message'
+  }),
+  'whatsapp': () => ({
+    parameters: {
+      operation: 'sendMessage',
+      to: 'your-phone-number',
+      message: 'Notification from workflow'
     },
-    'instagram': {
-      parameters: {
-        operation: 'createPost',
-        caption: 'Automated post from workflow'
-      },
-      name: 'Create Instagram Post'
+    name: 'Send WhatsApp Message'
+  }),
+  'instagram': () => ({
+    parameters: {
+      operation: 'createPost',
+      caption: 'Automated post from workflow'
     },
-    'twitter': {
-      parameters: {
-        operation: 'tweet',
-        text: 'Automated tweet from workflow'
-      },
-      name: 'Send Tweet'
+    name: 'Create Instagram Post'
+  }),
+  'twitter': () => ({
+    parameters: {
+      operation: 'tweet',
+      text: 'Automated tweet from workflow'
     },
-    'youtube': {
-      parameters: {
-        operation: 'get',
-        resource: 'video'
-      },
-      name: 'Get YouTube Video'
+    name: 'Send Tweet'
+  }),
+  'youtube': () => ({
+    parameters: {
+      operation: 'get',
+      resource: 'video'
     },
-    'mailchimp': {
-      parameters: {
-        operation: 'addMember',
-        listId: 'your-list-id',
-        email: 'subscriber@example.com'
-      },
-      name: 'Add to Mailchimp'
+    name: 'Get YouTube Video'
+  }),
+  'mailchimp': () => ({
+    parameters: {
+      operation: 'addMember',
+      listId: 'your-list-id',
+      email: 'subscriber@example.com'
     },
-    'woocommerce': {
-      parameters: {
-        operation: 'get',
-        resource: 'order'
-      },
-      name: 'Get WooCommerce Order'
+    name: 'Add to Mailchimp'
+  }),
+  'woocommerce': () => ({
+    parameters: {
+      operation: 'get',
+      resource: 'order'
     },
-    'dropbox': {
-      parameters: {
-        operation: 'upload',
-        path: '/backup/',
-        binary: true
-      },
-      name: 'Upload to Dropbox'
+    name: 'Get WooCommerce Order'
+  }),
+  'dropbox': () => ({
+    parameters: {
+      operation: 'upload',
+      path: '/backup/',
+      binary: true
     },
-    'google_drive': {
-      parameters: {
-        operation: 'upload',
-        folderId: 'your-folder-id'
-      },
-      name: 'Upload to Google Drive'
+    name: 'Upload to Dropbox'
+  }),
+  'google_drive': () => ({
+    parameters: {
+      operation: 'upload',
+      folderId: 'your-folder-id'
     },
-    'asana': {
-      parameters: {
-        operation: 'create',
-        resource: 'task',
-        name: 'New task from workflow'
-      },
-      name: 'Create Asana Task'
+    name: 'Upload to Google Drive'
+  }),
+  'asana': () => ({
+    parameters: {
+      operation: 'create',
+      resource: 'task',
+      name: 'New task from workflow'
     },
-    'typeform': {
-      parameters: {
-        operation: 'getAll',
-        formId: 'your-form-id'
-      },
-      name: 'Get Typeform Responses'
+    name: 'Create Asana Task'
+  }),
+  'typeform': () => ({
+    parameters: {
+      operation: 'getAll',
+      formId: 'your-form-id'
     },
-    'onedrive': {
-      parameters: {
-        operation: 'upload',
-        path: '/documents/'
-      },
-      name: 'Upload to OneDrive'
+    name: 'Get Typeform Responses'
+  }),
+  'onedrive': () => ({
+    parameters: {
+      operation: 'upload',
+      path: '/documents/'
     },
-    'hubspot': {
-      parameters: {
-        operation: 'getAll',
-        resource: 'deal'
-      },
-      name: 'Get HubSpot Deals'
-    }
-  };
+    name: 'Upload to OneDrive'
+  }),
+  'hubspot': () => ({
+    parameters: {
+      operation: 'getAll',
+      resource: 'deal'
+    },
+    name: 'Get HubSpot Deals'
+  })
+};
+
+function createActionNode(service, desc, index) {
+  const nodeId = generateNodeId();
   
-  const config = actionConfigs[service] || {
+  const buildConfig = ACTION_NODE_CONFIGS[service];
+  const config = buildConfig ? buildConfig(desc) : {
     parameters: {
       jsCode: `// Process workflow data for ${service}
 const inputData = $input.all();
@@ -661,30 +779,36 @@ return processedData;`
   };
 }
 
+// Node types that may legitimately have no incoming connection
+const CONNECTION_TRIGGER_TYPES = new Set(['n8n-nodes-base.webhook', 'n8n-nodes-base.scheduleTrigger', 'n8n-nodes-base.manualTrigger']);
+
 function validateWorkflowConnections(workflow) {
   const issues = [];
   const { nodes, connections } = workflow;
   
   // Check for triggers
-  const triggerTypes = ['n8n-nodes-base.webhook', 'n8n-nodes-base.scheduleTrigger', 'n8n-nodes-base.manualTrigger'];
-  const triggers = nodes.filter(node => triggerTypes.includes(node.type));
+  const triggers = nodes.filter(node => CONNECTION_TRIGGER_TYPES.has(node.type));
   
   if (triggers.length === 0) {
     issues.push('Workflow must have at least one trigger node');
   }
   
-  // Check all connections reference existing nodes
-  const nodeNames = nodes.map(n => n.name);
+  // Single walk over the connection graph: check that sources and targets
+  // exist while collecting every node that takes part in a connection
+  const nodeNames = new Set(nodes.map(n => n.name));
+  const connectedNodes = new Set();
   for (const [sourceName, nodeConnections] of Object.entries(connections)) {
-    if (!nodeNames.includes(sourceName)) {
+    connectedNodes.add(sourceName);
+    const sourceExists = nodeNames.has(sourceName);
+    if (!sourceExists) {
       issues.push(`Connection source '${sourceName}' does not exist`);
-      continue;
     }
     
     if (nodeConnections.main) {
       for (const connectionGroup of nodeConnections.main) {
         for (const connection of connectionGroup) {
-          if (!nodeNames.includes(connection.node)) {
+          connectedNodes.add(connection.node);
+          if (sourceExists && !nodeNames.has(connection.node)) {
             issues.push(`Connection target '${connection.node}' does not exist`);
           }
         }
@@ -693,19 +817,8 @@ function validateWorkflowConnections(workflow) {
   }
   
   // Check for unconnected non-trigger nodes
-  const connectedNodes = new Set(Object.keys(connections));
-  Object.values(connections).forEach(nodeConnections => {
-    if (nodeConnections.main) {
-      nodeConnections.main.forEach(connectionGroup => {
-        connectionGroup.forEach(connection => {
-          connectedNodes.add(connection.node);
-        });
-      });
-    }
-  });
-  
   const unconnectedNodes = nodes.filter(node => {
-    const isTrigger = triggerTypes.includes(node.type);
+    const isTrigger = CONNECTION_TRIGGER_TYPES.has(node.type);
     return !isTrigger && !connectedNodes.has(node.name);
   });
   
@@ -719,27 +832,36 @@ function validateWorkflowConnections(workflow) {
   };
 }
 
+// Title-case the first four words of the description. Scanning for
+// non-whitespace runs stops early and ignores repeated spaces or newlines.
+const WORKFLOW_NAME_WORD = /\S+/g;
+
+function buildWorkflowName(description) {
+  const words = [];
+  for (const [word] of description.matchAll(WORKFLOW_NAME_WORD)) {
+    words.push(word.charAt(0).toUpperCase() + word.slice(1).toLowerCase());
+    if (words.length === 4) break;
+  }
+  return words.join(' ') + ' Automation';
+}
+
 async function generateAdvancedWorkflow(description, triggerType, complexity) {
-  const analysis = analyzeDescription(description);
+  const desc = description.toLowerCase();
+  const analysis = analyzeDescriptionCached(desc);
   const workflowId = `workflow_${Date.now()}`;
   const nodes = [];
   const connections = {};
-  const desc = description.toLowerCase();
   
   // Generate workflow name from description
-  const workflowName = description
-    .split(' ')
-    .slice(0, 4)
-    .map(word => word.charAt(0).toUpperCase() + word.slice(1).toLowerCase())
-    .join(' ') + ' Automation';
+  const workflowName = buildWorkflowName(description);
   
   // Create trigger node
   let triggerNode;
   if (analysis.triggers.length > 0) {
-    triggerNode = createTriggerNode(analysis.triggers[0].service, description);
+    triggerNode = createTriggerNode(analysis.triggers[0].service, desc);
   } else {
     const defaultTrigger = desc.includes('monitor') || desc.includes('every') ? 'schedule' : 'webhook';
-    triggerNode = createTriggerNode(defaultTrigger, description);
+    triggerNode = createTriggerNode(defaultTrigger, desc);
   }
   nodes.push(triggerNode);
   
@@ -749,7 +871,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
   // For monitoring workflows, create specific flow
   if (desc.includes('monitor') && desc.includes('api')) {
     // Add HTTP request node
-    const httpNode = createActionNode('http_request', description, nodeIndex++);
+    const httpNode = createActionNode('http_request', desc, nodeIndex++);
     nodes.push(httpNode);
     
     connections[previousNode.name] = {
@@ -758,7 +880,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
     previousNode = httpNode;
     
     // Add response time processing
-    const processNode = createActionNode('code', description, nodeIndex++);
+    const processNode = createActionNode('code', desc, nodeIndex++);
     nodes.push(processNode);
     
     connections[previousNode.name] = {
@@ -768,7 +890,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
     
     // Add condition check
     if (desc.includes('exceeds') || desc.includes('greater') || desc.includes('threshold')) {
-      const conditionNode = createActionNode('if', description, nodeIndex++);
+      const conditionNode = createActionNode('if', desc, nodeIndex++);
       nodes.push(conditionNode);
       
       connections[previousNode.name] = {
@@ -779,7 +901,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
     
     // Add alert node
     if (desc.includes('alert') || desc.includes('notify')) {
-      const alertNode = createActionNode('slack', description, nodeIndex++);
+      const alertNode = createActionNode('slack', desc, nodeIndex++);
       nodes.push(alertNode);
       
       connections[previousNode.name] = {
@@ -803,7 +925,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
     // If we have specific services, create nodes for them
     if (servicesToCreate.length > 0) {
       servicesToCreate.forEach((service, index) => {
-        const actionNode = createActionNode(service.service, description, nodeIndex + index);
+        const actionNode = createActionNode(service.service, desc, nodeIndex + index);
         nodes.push(actionNode);
         
         connections[previousNode.name] = {
@@ -815,7 +937,7 @@ async function generateAdvancedWorkflow(description, triggerType, complexity) {
       nodeIndex += servicesToCreate.length;
     } else {
       // Create a generic processing node only if no specific services
-      const processNode = createActionNode('code', description, nodeIndex++);
+      const processNode = createActionNode('code', desc, nodeIndex++);
       nodes.push(processNode);
       
       connections[previousNode.name] = {
@@ -883,8 +1005,7 @@ return [{ json: errorLog }];`
   
   // Apply proactive error prevention
   try {
-    const prevention = new ProactiveErrorPrevention();
-    const proactiveResult = await prevention.validateAndFixAnyWorkflow(workflow, {
+    const proactiveResult = await errorPrevention.validateAndFixAnyWorkflow(workflow, {
       source: 'api_generation',
       prompt: description,
       complexity: complexity
@@ -911,41 +1032,47 @@ return [{ json: errorLog }];`
   }
 }
 
-// Template definitions
-const TEMPLATES = {
-  'rss_to_social': {
-    id: 'rss_to_social',
-    name: 'RSS to Social Media',
-    description: 'Monitor RSS feeds and automatically post new articles to social media platforms like Twitter and LinkedIn',
-    category: 'social_media',
-    complexity: 'medium',
-    use_cases: ['Content automation', 'Social media management', 'Blog promotion']
-  },
-  'email_processing': {
-    id: 'email_processing',
-    name: 'Email Processing',
-    description: 'Process incoming emails, extract attachments, validate content, and route to appropriate team members',
-    category: 'communication',
-    complexity: 'medium',
-    use_cases: ['Customer support', 'Document processing', 'Email automation']
-  },
-  'data_backup': {
-    id: 'data_backup',
-    name: 'Data Backup',
-    description: 'Automatically backup files from Google Drive to Dropbox and send confirmation emails',
-    category: 'storage',
-    complexity: 'simple',
-    use_cases: ['Data protection', 'Cloud storage sync', 'Automated backups']
-  },
-  'ecommerce_orders': {
-    id: 'ecommerce_orders',
-    name: 'E-commerce Orders',
-    description: 'Process new Shopify orders, update inventory, send confirmation emails, and create shipping labels',
-    category: 'ecommerce',
-    complexity: 'complex',
-    use_cases: ['Order fulfillment', 'Inventory management', 'Customer communication']
+// Template definitions live in templates.json as a list; require() parses them
+// once at load. The same objects are shared by every request, so they are frozen.
+const TEMPLATE_LIST = Object.freeze(require('./templates.json'));
+
+const TEMPLATES = {};
+// Lowercased search text per template id, computed once so queries only
+// lowercase the query itself
+const TEMPLATE_SEARCH_TEXT = new Map();
+
+// Register every template in one pass: freeze, index by id, and lowercase its text
+for (const template of TEMPLATE_LIST) {
+  Object.freeze(template.use_cases);
+  TEMPLATES[template.id] = Object.freeze(template);
+  
+  const searchText = {
+    description: template.description.toLowerCase(),
+    category: template.category,
+    useCases: template.use_cases.map(useCase => useCase.toLowerCase())
+  };
+  TEMPLATE_SEARCH_TEXT.set(template.id, searchText);
+}
+Object.freeze(TEMPLATES);
+
+function templateMatchesQuery(template, query) {
+  const searchText = TEMPLATE_SEARCH_TEXT.get(template.id);
+  return searchText.description.includes(query) ||
+         searchText.category.includes(query) ||
+         searchText.useCases.some(useCase => useCase.includes(query));
+}
+
+// Suggest up to `limit` templates whose text contains `query` (lowercased)
+function suggestTemplates(query, limit = 3) {
+  const suggestions = [];
+  for (const template of TEMPLATE_LIST) {
+    if (templateMatchesQuery(template, query)) {
+      suggestions.push(template);
+      if (suggestions.length === limit) break;
+    }
   }
-};
+  return suggestions;
+}
 
 module.exports = async (req, res) => {
   // Set CORS headers
@@ -969,12 +1096,7 @@ module.exports = async (req, res) => {
         const body = getRequestBody(req);
         const description = body.description?.toLowerCase() || '';
         
-        // Simple template suggestion logic
-        const suggestions = Object.values(TEMPLATES).filter(template => {
-          return template.description.toLowerCase().includes(description) ||
-                 template.category.includes(description) ||
-                 template.use_cases.some(useCase => useCase.toLowerCase().includes(description));
-        }).slice(0, 3);
+        const suggestions = suggestTemplates(description);
         
         res.status(200).json({
           success: true,
@@ -983,10 +1105,12 @@ module.exports = async (req, res) => {
         return;
       }
       
-      if (TEMPLATES[templateId]) {
+      // Own-property lookup so ids like 'constructor' don't resolve to prototype members
+      const template = Object.hasOwn(TEMPLATES, templateId) ? TEMPLATES[templateId] : undefined;
+      if (template) {
         res.status(200).json({
           success: true,
-          template: TEMPLATES[templateId]
+          template
         });
         return;
       } else {
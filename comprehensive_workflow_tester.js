@@ -11,6 +11,25 @@
 
 const apiHandler = require('./api/index.js');
 
+// Node categories that count as doing work after the trigger
+const ACTION_CATEGORIES = new Set(['action', 'processing', 'logic', 'ai', 'payment']);
+
+// Per-type parameter quality checks; each returns an issue message or null
+const PARAMETER_QUALITY_CHECKS = new Map([
+  ['n8n-nodes-base.httpRequest', (node) =>
+    node.parameters.url && node.parameters.url.startsWith('http')
+      ? null
+      : `Node '${node.name}' has invalid URL`],
+  ['n8n-nodes-base.code', (node) =>
+    node.parameters.jsCode && node.parameters.jsCode.length > 50
+      ? null
+      : `Node '${node.name}' has insufficient code`],
+  ['n8n-nodes-base.slack', (node) =>
+    node.parameters.channel && node.parameters.text
+      ? null
+      : `Node '${node.name}' missing Slack channel or text`]
+]);
+
 class WorkflowValidator {
   constructor() {
     this.validNodeTypes = {
@@ -86,6 +105,9 @@ class WorkflowValidator {
       'mailchimp': ['mailchimp', 'email', 'audience'],
       'woocommerce': ['woocommerce', 'order', 'inventory']
     };
+
+    // Detected services per description; each test case asks twice
+    this.detectedServicesCache = new Map();
   }
 
   async validateWorkflow(testCase) {
@@ -219,7 +241,7 @@ class WorkflowValidator {
 
     // Check for action nodes
     const actionNodes = workflow.nodes.filter(node => 
-      ['action', 'processing', 'logic', 'ai', 'payment'].includes(this.validNodeTypes[node.type]?.category)
+      ACTION_CATEGORIES.has(this.validNodeTypes[node.type]?.category)
     );
     if (actionNodes.length === 0) {
       issues.push('No action nodes found');
@@ -366,27 +388,13 @@ class WorkflowValidator {
       }
 
       // Check parameter quality for specific node types
-      if (node.type === 'n8n-nodes-base.httpRequest') {
-        if (node.parameters.url && node.parameters.url.startsWith('http')) {
-          nodeScore += 0.5;
+      const qualityCheck = PARAMETER_QUALITY_CHECKS.get(node.type);
+      if (qualityCheck) {
+        const qualityIssue = qualityCheck(node);
+        if (qualityIssue) {
+          issues.push(qualityIssue);
         } else {
-          issues.push(`Node '${node.name}' has invalid URL`);
-        }
-      }
-
-      if (node.type === 'n8n-nodes-base.code') {
-        if (node.parameters.jsCode && node.parameters.jsCode.length > 50) {
           nodeScore += 0.5;
-        } else {
-          issues.push(`Node '${node.name}' has insufficient code`);
-        }
-      }
-
-      if (node.type === 'n8n-nodes-base.slack') {
-        if (node.parameters.channel && node.parameters.text) {
-          nodeScore += 0.5;
-        } else {
-          issues.push(`Node '${node.name}' missing Slack channel or text`);
         }
       }
     }
@@ -536,6 +544,9 @@ class WorkflowValidator {
 
   // Helper methods
   detectServicesInDescription(description) {
+    const cached = this.detectedServicesCache.get(description);
+    if (cached) return cached;
+    
     const desc = description.toLowerCase();
     const services = [];
     
@@ -545,6 +556,9 @@ class WorkflowValidator {
       }
     }
     
+    // Shared between callers, so freeze it against accidental mutation
+    Object.freeze(services);
+    this.detectedServicesCache.set(description, services);
     return services;
   }
 
@@ -587,17 +601,22 @@ class WorkflowValidator {
   }
 
   checkLogicalSequence(workflow, description) {
-    // Simple heuristic: trigger should come first, actions should follow
-    const triggerNodes = workflow.nodes.filter(node => 
-      this.validNodeTypes[node.type]?.category === 'trigger'
-    );
+    // Simple heuristic: trigger should come first, actions should follow.
+    // One pass finds the first trigger and the earliest x position together.
+    let triggerNode = null;
+    let earliestX = Infinity;
+    for (const node of workflow.nodes) {
+      if (!triggerNode && this.validNodeTypes[node.type]?.category === 'trigger') {
+        triggerNode = node;
+      }
+      if (node.position[0] < earliestX) {
+        earliestX = node.position[0];
+      }
+    }
     
-    if (triggerNodes.length === 0) return false;
+    if (!triggerNode) return false;
     
     // Check if trigger has the earliest position
-    const triggerNode = triggerNodes[0];
-    const earliestX = Math.min(...workflow.nodes.map(n => n.position[0]));
-    
     return triggerNode.position[0] === earliestX;
   }
 
@@ -69,28 +69,26 @@ try {
 // Step 3: Check for consistency
 console.log('\n🔄 Checking Version Consistency:');
 
-const versions = {};
-try {
-    const pkg = JSON.parse(fs.readFileSync('package.json', 'utf8'));
-    versions.package = pkg.engines?.node;
-} catch {}
-
-try {
-    const vercel = JSON.parse(fs.readFileSync('vercel.json', 'utf8'));
-    versions.vercel = vercel.functions?.['api/index.js']?.runtime;
-} catch {}
-
-try {
-    versions.nvmrc = fs.readFileSync('.nvmrc', 'utf8').trim();
-} catch {}
-
-try {
-    versions.nodeVersion = fs.readFileSync('.node-version', 'utf8').trim();
-} catch {}
+// Read an optional version file; a missing file is expected and skipped
+// quietly, anything else (bad JSON, permissions) is reported
+function readOptional(file, parse = content => content.trim()) {
+    try {
+        return parse(fs.readFileSync(file, 'utf8'));
+    } catch (error) {
+        if (error.code !== 'ENOENT') {
+            console.log(`   ⚠️  Could not read ${file}: ${error.message}`);
+        }
+        return undefined;
+    }
+}
 
-try {
-    versions.runtime = fs.readFileSync('runtime.txt', 'utf8').trim();
-} catch {}
+const versions = {
+    package: readOptional('package.json', content => JSON.parse(content).engines?.node),
+    vercel: readOptional('vercel.json', content => JSON.parse(content).functions?.['api/index.js']?.runtime),
+    nvmrc: readOptional('.nvmrc'),
+    nodeVersion: readOptional('.node-version'),
+    runtime: readOptional('runtime.txt')
+};
 
 console.log('   Version specifications:');
 Object.entries(versions).forEach(([file, version]) => {
@@ -131,15 +131,13 @@ class WorkflowNodeValidator {
    */
   validateConnections(nodes, connections) {
     const issues = [];
-    const nodeNames = nodes.map(n => n.name);
+    const validNodeTypes = this.validNodeTypes;
+    const nodeNames = new Set(nodes.map(n => n.name));
     const connectedNodes = new Set();
-    const triggerNodes = nodes.filter(n => 
-      this.validNodeTypes[n.type] && !this.validNodeTypes[n.type].requiresInput
-    );
     
     // Check if connections reference existing nodes
     for (const [sourceName, nodeConnections] of Object.entries(connections)) {
-      if (!nodeNames.includes(sourceName)) {
+      if (!nodeNames.has(sourceName)) {
         issues.push(`Connection source '${sourceName}' does not exist`);
         continue;
       }
@@ -149,7 +147,7 @@ class WorkflowNodeValidator {
       if (nodeConnections.main) {
         for (const connectionGroup of nodeConnections.main) {
           for (const connection of connectionGroup) {
-            if (!nodeNames.includes(connection.node)) {
+            if (!nodeNames.has(connection.node)) {
               issues.push(`Connection target '${connection.node}' does not exist`);
             } else {
               connectedNodes.add(connection.node);
@@ -159,16 +157,20 @@ class WorkflowNodeValidator {
       }
     }
     
-    // Check for unconnected nodes (except triggers)
+    // Check for unconnected nodes (except triggers), noting triggers on the way
+    let hasTrigger = false;
     for (const node of nodes) {
-      const nodeSpec = this.validNodeTypes[node.type];
-      if (nodeSpec && nodeSpec.requiresInput && !connectedNodes.has(node.name)) {
+      const nodeSpec = validNodeTypes[node.type];
+      if (!nodeSpec) continue;
+      if (!nodeSpec.requiresInput) {
+        hasTrigger = true;
+      } else if (!connectedNodes.has(node.name)) {
         issues.push(`Unconnected node: ${node.name} (requires input connection)`);
       }
     }
     
     // Check if workflow has at least one trigger
-    if (triggerNodes.length === 0) {
+    if (!hasTrigger) {
       issues.push('Workflow has no trigger nodes');
     }
     
@@ -176,12 +178,11 @@ class WorkflowNodeValidator {
   }
 
   /**
-   * Fix unconnected nodes by creating proper connections
+   * Fix unconnected nodes by creating proper connections (mutates connections in place)
    */
   fixUnconnectedNodes(nodes, connections) {
     const fixes = [];
     let fixed = false;
-    const newConnections = { ...connections };
     
     const triggerNodes = nodes.filter(n => 
       this.validNodeTypes[n.type] && !this.validNodeTypes[n.type].requiresInput
@@ -211,16 +212,16 @@ class WorkflowNodeValidator {
       let previousNode = triggerNodes[0]; // Start with first trigger
       
       for (const unconnectedNode of unconnectedNodes) {
-        if (!newConnections[previousNode.name]) {
-          newConnections[previousNode.name] = { main: [[]] };
+        if (!connections[previousNode.name]) {
+          connections[previousNode.name] = { main: [[]] };
         }
         
-        if (!newConnections[previousNode.name].main[0]) {
-          newConnections[previousNode.name].main[0] = [];
+        if (!connections[previousNode.name].main[0]) {
+          connections[previousNode.name].main[0] = [];
         }
         
         // Add connection
-        newConnections[previousNode.name].main[0].push({
+        connections[previousNode.name].main[0].push({
           node: unconnectedNode.name,
           type: 'main',
           index: 0
@@ -232,19 +233,18 @@ class WorkflowNodeValidator {
       }
     }
     
-    return { fixed, connections: newConnections, fixes };
+    return { fixed, connections: connections, fixes };
   }
 
   /**
-   * Fix invalid nodes by correcting common issues
+   * Fix invalid nodes by correcting common issues (mutates nodes in place)
    */
   fixInvalidNodes(nodes) {
     const fixes = [];
     let fixed = false;
-    const newNodes = [...nodes];
     
-    for (let i = 0; i < newNodes.length; i++) {
-      const node = newNodes[i];
+    for (let i = 0; i < nodes.length; i++) {
+      const node = nodes[i];
       
       // Fix missing id
       if (!node.id) {
@@ -287,7 +287,7 @@ return inputData;`
       }
     }
     
-    return { fixed, nodes: newNodes, fixes };
+    return { fixed, nodes, fixes };
   }
 
   /**
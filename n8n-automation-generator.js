@@ -294,7 +294,7 @@ class N8nAutomationGenerator {
 
   generateTestSuite(count = 10000) {
     console.log(`Generating ${count} n8n automation test scenarios...`);
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     const workflows = [];
     const stats = {
@@ -319,7 +319,7 @@ class N8nAutomationGenerator {
       }
     }
     
-    const endTime = Date.now();
+    const endTime = performance.now();
     const duration = endTime - startTime;
     
     return {
@@ -327,7 +327,7 @@ class N8nAutomationGenerator {
       statistics: {
         ...stats,
         averageNodesPerWorkflow: Math.round(stats.totalNodes / count * 100) / 100,
-        generationTime: `${duration}ms`,
+        generationTime: `${duration.toFixed(2)}ms`,
         workflowsPerSecond: Math.round(count / (duration / 1000))
       }
     };
@@ -1,8 +1,131 @@
 // n8n Iterative Test Runner - Identifies and fixes issues one by one
 const fs = require('fs');
 
+// Building blocks for generated test workflows; shared by every test
+const TRIGGERS = Object.freeze([
+  'Manual Trigger', 'Webhook', 'Schedule Trigger', 'Form Trigger',
+  'Email Trigger (IMAP)', 'File Trigger', 'HTTP Request Trigger',
+  'Slack Trigger', 'Discord Trigger', 'Google Sheets Trigger'
+]);
+
+// Triggers that learnings showed to be reliable
+const RELIABLE_TRIGGERS = Object.freeze(['Manual Trigger', 'Schedule Trigger', 'Webhook']);
+
+const PROCESSING_NODES = Object.freeze([
+  'Code (JavaScript)', 'Set', 'Edit Fields', 'Split Out',
+  'Aggregate', 'Sort', 'Limit', 'Remove Duplicates', 'Merge'
+]);
+
+const INTEGRATIONS = Object.freeze([
+  'HTTP Request', 'Slack', 'Gmail', 'Google Sheets', 'Notion',
+  'Trello', 'Salesforce', 'HubSpot', 'Mailchimp', 'Twilio'
+]);
+
+const BUSINESS_SCENARIOS = Object.freeze([
+  'Lead Management', 'Customer Onboarding', 'Order Processing',
+  'Support Ticket Routing', 'Data Backup', 'Report Generation'
+]);
+
+const STEP_PURPOSES = Object.freeze([
+  'Data validation and cleaning',
+  'Format transformation', 
+  'Field extraction and mapping',
+  'Duplicate removal',
+  'Data enrichment'
+]);
+
+const INTEGRATION_ACTIONS = Object.freeze([
+  'Send notification',
+  'Create record', 
+  'Update existing data',
+  'Generate report',
+  'Upload file'
+]);
+
+// Fixes per issue category. A recipe applies when the issue description
+// contains `match`; `apply` edits the workflow in place and returns the fix
+// description, or null if there was nothing to change.
+const FIX_RECIPES = Object.freeze({
+  VALIDATION: Object.freeze([
+    Object.freeze({
+      match: 'missing trigger',
+      apply: workflow => {
+        workflow.trigger = {
+          type: 'Manual Trigger',
+          config: { description: 'Added default trigger' }
+        };
+        return 'Added missing trigger node';
+      }
+    })
+  ]),
+  PERFORMANCE: Object.freeze([
+    Object.freeze({
+      match: 'Too many nodes',
+      apply: workflow => {
+        // Reduce processing steps
+        workflow.processingSteps = workflow.processingSteps.slice(0, 5);
+        return 'Reduced number of processing steps';
+      }
+    }),
+    Object.freeze({
+      match: 'Sorting without limit',
+      apply: workflow => {
+        // Add limit node after sort
+        const sortIndex = workflow.processingSteps.findIndex(step => step.node === 'Sort');
+        if (sortIndex === -1) return null;
+        workflow.processingSteps.splice(sortIndex + 1, 0, {
+          node: 'Limit',
+          purpose: 'Limit results for performance',
+          config: { limit: 100 }
+        });
+        return 'Added limit node after sort for performance';
+      }
+    })
+  ]),
+  RELIABILITY: Object.freeze([
+    Object.freeze({
+      match: 'error handling',
+      apply: workflow => {
+        workflow.processingSteps.push({
+          node: 'Stop and Error',
+          purpose: 'Handle workflow errors',
+          config: { errorMessage: 'Workflow execution failed' }
+        });
+        return 'Added error handling node';
+      }
+    })
+  ]),
+  DATA_QUALITY: Object.freeze([
+    Object.freeze({
+      match: 'data validation',
+      apply: workflow => {
+        workflow.processingSteps.unshift({
+          node: 'Code (JavaScript)',
+          purpose: 'Data validation and cleaning',
+          config: { code: 'return $input.all().filter(item => item.json && Object.keys(item.json).length > 0);' }
+        });
+        return 'Added data validation step';
+      }
+    })
+  ])
+});
+
+// Small seedable PRNG (mulberry32) so a test run can be reproduced exactly
+function createSeededRandom(seed) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
 class N8nIterativeTestRunner {
-  constructor() {
+  constructor(options = {}) {
+    // Pass { seed } for a reproducible run; otherwise use Math.random
+    this.random = options.seed === undefined ? Math.random : createSeededRandom(options.seed);
     this.testResults = [];
     this.issuesFound = [];
     this.fixesApplied = [];
@@ -66,7 +189,7 @@ class N8nIterativeTestRunner {
   }
 
   async runSingleTest(testId) {
-    const startTime = Date.now();
+    const startTime = performance.now();
     
     try {
       // Generate workflow
@@ -84,7 +207,7 @@ class N8nIterativeTestRunner {
       // Re-validate after fixes
       const finalValidation = await this.validateWorkflow(fixedWorkflow);
       
-      const endTime = Date.now();
+      const endTime = performance.now();
       const testTime = endTime - startTime;
       
       // Update performance metrics
@@ -108,7 +231,7 @@ class N8nIterativeTestRunner {
       return testResult;
       
     } catch (error) {
-      const endTime = Date.now();
+      const endTime = performance.now();
       const testTime = endTime - startTime;
       
       const errorResult = {
@@ -128,36 +251,16 @@ class N8nIterativeTestRunner {
 
   generateWorkflow(id) {
     // Enhanced workflow generation with learned patterns
-    const triggers = [
-      'Manual Trigger', 'Webhook', 'Schedule Trigger', 'Form Trigger',
-      'Email Trigger (IMAP)', 'File Trigger', 'HTTP Request Trigger',
-      'Slack Trigger', 'Discord Trigger', 'Google Sheets Trigger'
-    ];
-
-    const processingNodes = [
-      'Code (JavaScript)', 'Set', 'Edit Fields', 'Split Out',
-      'Aggregate', 'Sort', 'Limit', 'Remove Duplicates', 'Merge'
-    ];
-
-    const integrations = [
-      'HTTP Request', 'Slack', 'Gmail', 'Google Sheets', 'Notion',
-      'Trello', 'Salesforce', 'HubSpot', 'Mailchimp', 'Twilio'
-    ];
-
-    const businessScenarios = [
-      'Lead Management', 'Customer Onboarding', 'Order Processing',
-      'Support Ticket Routing', 'Data Backup', 'Report Generation'
-    ];
-
+    
     // Apply learned patterns to avoid known issues
-    const trigger = this.selectOptimalTrigger(triggers);
-    const scenario = this.getRandomItem(businessScenarios);
+    const trigger = this.selectOptimalTrigger(TRIGGERS);
+    const scenario = this.getRandomItem(BUSINESS_SCENARIOS);
     
     // Generate processing steps with validation
-    const processingSteps = this.generateValidProcessingSteps(processingNodes);
+    const processingSteps = this.generateValidProcessingSteps(PROCESSING_NODES);
     
     // Generate integrations with compatibility checks
-    const workflowIntegrations = this.generateCompatibleIntegrations(integrations, trigger);
+    const workflowIntegrations = this.generateCompatibleIntegrations(INTEGRATIONS, trigger);
     
     // Add conditional logic with proper validation
     const conditional = this.generateValidConditional();
@@ -323,7 +426,7 @@ class N8nIterativeTestRunner {
       workflow.metadata = {};
     }
     workflow.metadata.estimatedExecutionTime = estimatedTime;
-    workflow.metadata.estimatedExecutions = Math.floor(Math.random() * 1000) + 100; // Simulate execution count
+    workflow.metadata.estimatedExecutions = Math.floor(this.random() * 1000) + 100; // Simulate execution count
   }
 
   identifyIssues(workflow, validationResult) {
@@ -423,7 +526,14 @@ class N8nIterativeTestRunner {
   }
 
   async applyFixes(workflow, issues) {
-    let fixedWorkflow = JSON.parse(JSON.stringify(workflow)); // Deep clone
+    // Copy-on-write: fixes only replace the trigger, edit the processingSteps
+    // array and update metadata, so those are the only parts copied. Steps,
+    // integrations and the conditional stay shared with the original.
+    let fixedWorkflow = {
+      ...workflow,
+      processingSteps: workflow.processingSteps && [...workflow.processingSteps],
+      metadata: workflow.metadata && { ...workflow.metadata }
+    };
     const appliedFixes = [];
 
     for (const issue of issues) {
@@ -446,105 +556,24 @@ class N8nIterativeTestRunner {
 
   async generateFix(workflow, issue) {
     const fix = { applied: false, workflow: workflow, description: '' };
+    const recipes = FIX_RECIPES[issue.category] || [];
+
+    for (const { match, apply } of recipes) {
+      if (!issue.description.includes(match)) continue;
+      const description = apply(workflow);
+      if (description) {
+        fix.applied = true;
+        fix.description = description;
+      }
+    }
 
-    switch (issue.category) {
-      case 'VALIDATION':
-        if (issue.description.includes('missing trigger')) {
-          workflow.trigger = {
-            type: 'Manual Trigger',
-            config: { description: 'Added default trigger' }
-          };
-          // Update estimated nodes
-          if (workflow.metadata) {
-            workflow.metadata.estimatedNodes = this.estimateNodes(
-              workflow.processingSteps, 
-              workflow.conditional, 
-              workflow.integrations
-            );
-          }
-          fix.applied = true;
-          fix.description = 'Added missing trigger node';
-        }
-        break;
-
-      case 'PERFORMANCE':
-        if (issue.description.includes('Too many nodes')) {
-          // Reduce processing steps
-          workflow.processingSteps = workflow.processingSteps.slice(0, 5);
-          // Update estimated nodes
-          if (workflow.metadata) {
-            workflow.metadata.estimatedNodes = this.estimateNodes(
-              workflow.processingSteps, 
-              workflow.conditional, 
-              workflow.integrations
-            );
-          }
-          fix.applied = true;
-          fix.description = 'Reduced number of processing steps';
-        }
-        
-        if (issue.description.includes('Sorting without limit')) {
-          // Add limit node after sort
-          const sortIndex = workflow.processingSteps.findIndex(step => step.node === 'Sort');
-          if (sortIndex !== -1) {
-            workflow.processingSteps.splice(sortIndex + 1, 0, {
-              node: 'Limit',
-              purpose: 'Limit results for performance',
-              config: { limit: 100 }
-            });
-            // Update estimated nodes
-            if (workflow.metadata) {
-              workflow.metadata.estimatedNodes = this.estimateNodes(
-                workflow.processingSteps, 
-                workflow.conditional, 
-                workflow.integrations
-              );
-            }
-            fix.applied = true;
-            fix.description = 'Added limit node after sort for performance';
-          }
-        }
-        break;
-
-      case 'RELIABILITY':
-        if (issue.description.includes('error handling')) {
-          workflow.processingSteps.push({
-            node: 'Stop and Error',
-            purpose: 'Handle workflow errors',
-            config: { errorMessage: 'Workflow execution failed' }
-          });
-          // Update estimated nodes
-          if (workflow.metadata) {
-            workflow.metadata.estimatedNodes = this.estimateNodes(
-              workflow.processingSteps, 
-              workflow.conditional, 
-              workflow.integrations
-            );
-          }
-          fix.applied = true;
-          fix.description = 'Added error handling node';
-        }
-        break;
-
-      case 'DATA_QUALITY':
-        if (issue.description.includes('data validation')) {
-          workflow.processingSteps.unshift({
-            node: 'Code (JavaScript)',
-            purpose: 'Data validation and cleaning',
-            config: { code: 'return $input.all().filter(item => item.json && Object.keys(item.json).length > 0);' }
-          });
-          // Update estimated nodes
-          if (workflow.metadata) {
-            workflow.metadata.estimatedNodes = this.estimateNodes(
-              workflow.processingSteps, 
-              workflow.conditional, 
-              workflow.integrations
-            );
-          }
-          fix.applied = true;
-          fix.description = 'Added data validation step';
-        }
-        break;
+    // Update estimated nodes
+    if (fix.applied && workflow.metadata) {
+      workflow.metadata.estimatedNodes = this.estimateNodes(
+        workflow.processingSteps, 
+        workflow.conditional, 
+        workflow.integrations
+      );
     }
 
     return fix;
@@ -603,15 +632,14 @@ class N8nIterativeTestRunner {
   // Helper methods
   selectOptimalTrigger(triggers) {
     // Use learnings to select better triggers
-    const reliableTriggers = ['Manual Trigger', 'Schedule Trigger', 'Webhook'];
-    const availableTriggers = triggers.filter(t => reliableTriggers.includes(t));
+    const availableTriggers = triggers.filter(t => RELIABLE_TRIGGERS.includes(t));
     return availableTriggers.length > 0 ? 
            this.getRandomItem(availableTriggers) : 
            this.getRandomItem(triggers);
   }
 
   generateValidProcessingSteps(nodes) {
-    const stepCount = Math.floor(Math.random() * 3) + 2; // 2-4 steps
+    const stepCount = Math.floor(this.random() * 3) + 2; // 2-4 steps
     const steps = [];
     
     for (let i = 0; i < stepCount; i++) {
@@ -627,7 +655,7 @@ class N8nIterativeTestRunner {
   }
 
   generateCompatibleIntegrations(integrations, trigger) {
-    const count = Math.floor(Math.random() * 2) + 1; // 1-2 integrations
+    const count = Math.floor(this.random() * 2) + 1; // 1-2 integrations
     const selected = [];
     
     for (let i = 0; i < count; i++) {
@@ -643,7 +671,7 @@ class N8nIterativeTestRunner {
   }
 
   generateValidConditional() {
-    if (Math.random() < 0.3) { // 30% chance
+    if (this.random() < 0.3) { // 30% chance
       return {
         node: 'IF',
         condition: 'Status equals "active"',
@@ -666,25 +694,11 @@ class N8nIterativeTestRunner {
   }
 
   generateStepPurpose() {
-    const purposes = [
-      'Data validation and cleaning',
-      'Format transformation', 
-      'Field extraction and mapping',
-      'Duplicate removal',
-      'Data enrichment'
-    ];
-    return this.getRandomItem(purposes);
+    return this.getRandomItem(STEP_PURPOSES);
   }
 
   generateIntegrationAction() {
-    const actions = [
-      'Send notification',
-      'Create record', 
-      'Update existing data',
-      'Generate report',
-      'Upload file'
-    ];
-    return this.getRandomItem(actions);
+    return this.getRandomItem(INTEGRATION_ACTIONS);
   }
 
   calculateComplexity(processingSteps, conditional, integrations) {
@@ -705,14 +719,40 @@ class N8nIterativeTestRunner {
     return nodes;
   }
 
+  selectTopPatterns(limit) {
+    // Bounded insertion instead of sorting every known pattern; ties keep
+    // first-seen order, matching a stable descending sort
+    const top = [];
+    for (const [pattern, count] of this.knownIssues) {
+      if (top.length === limit && count <= top[top.length - 1][1]) continue;
+      
+      let index = top.length;
+      while (index > 0 && top[index - 1][1] < count) index--;
+      top.splice(index, 0, [pattern, count]);
+      if (top.length > limit) top.pop();
+    }
+    return top;
+  }
+
+  // Tally PASSED/FAILED/ERROR results in a single pass over testResults
+  countResultsByStatus() {
+    let passedTests = 0;
+    let failedTests = 0;
+    let errorTests = 0;
+    for (const { status } of this.testResults) {
+      if (status === 'PASSED') passedTests++;
+      else if (status === 'FAILED') failedTests++;
+      else if (status === 'ERROR') errorTests++;
+    }
+    return { passedTests, failedTests, errorTests };
+  }
+
   getRandomItem(array) {
-    return array[Math.floor(Math.random() * array.length)];
+    return array[Math.floor(this.random() * array.length)];
   }
 
   generateProgressReport(currentTest) {
-    const passedTests = this.testResults.filter(r => r.status === 'PASSED').length;
-    const failedTests = this.testResults.filter(r => r.status === 'FAILED').length;
-    const errorTests = this.testResults.filter(r => r.status === 'ERROR').length;
+    const { passedTests, failedTests, errorTests } = this.countResultsByStatus();
     
     return {
       progress: `${currentTest}/10000`,
@@ -759,9 +799,7 @@ class N8nIterativeTestRunner {
 
   generateFinalReport() {
     const totalTests = this.testResults.length;
-    const passedTests = this.testResults.filter(r => r.status === 'PASSED').length;
-    const failedTests = this.testResults.filter(r => r.status === 'FAILED').length;
-    const errorTests = this.testResults.filter(r => r.status === 'ERROR').length;
+    const { passedTests, failedTests, errorTests } = this.countResultsByStatus();
     
     const issueCategories = {};
     this.issuesFound.forEach(issue => {
@@ -774,10 +812,7 @@ class N8nIterativeTestRunner {
     });
     
     // Calculate top patterns from known issues
-    const topPatterns = Array.from(this.knownIssues.entries())
-      .sort(([,a], [,b]) => b - a)
-      .slice(0, 10)
-      .map(([pattern, count]) => [pattern, count]);
+    const topPatterns = this.selectTopPatterns(10);
     
     return {
       summary: {
@@ -802,7 +837,7 @@ class N8nIterativeTestRunner {
       },
       learnings: {
         total: this.learnings.length,
-        unique: [...new Set(this.learnings)].length
+        unique: new Set(this.learnings).size
       }
     };
   }
@@ -4,35 +4,84 @@
  * Automatically prevents and fixes node connection issues in any scenario
  */
 
-const fs = require('fs');
-const path = require('path');
+// Static rule lists and node-type registry are shared by every instance
+const VALIDATION_RULES = Object.freeze({
+  // Critical validation rules that must always pass
+  critical: Object.freeze([
+    'mustHaveTrigger',
+    'noOrphanedNodes', 
+    'validConnections',
+    'noCircularDeps'
+  ]),
+  // Warning rules that should be checked but not block generation
+  warnings: Object.freeze([
+    'nodeNaming',
+    'positionOverlap',
+    'parameterCompleteness'
+  ])
+});
+
+// Validation rule name -> name of the method that checks it
+const VALIDATION_RULE_METHODS = Object.freeze({
+  'mustHaveTrigger': 'validateTriggerExists',
+  'noOrphanedNodes': 'validateNoOrphanedNodes',
+  'validConnections': 'validateConnections',
+  'noCircularDeps': 'validateNoCircularDependencies',
+  'nodeNaming': 'validateNodeNaming',
+  'positionOverlap': 'validateNodePositions',
+  'parameterCompleteness': 'validateParameters'
+});
+
+// Trigger node types that start a workflow and need no incoming connection
+const TRIGGER_TYPES = new Set([
+  'n8n-nodes-base.webhook',
+  'n8n-nodes-base.scheduleTrigger',
+  'n8n-nodes-base.manualTrigger'
+]);
+
+// Node types that satisfy the "must have a trigger" rule; RSS reads can
+// also start a workflow
+const ENTRY_POINT_TYPES = new Set([...TRIGGER_TYPES, 'n8n-nodes-base.rssFeedRead']);
+
+// Error type -> name of the fix method that handles it
+const AUTO_FIX_METHODS = Object.freeze({
+  'missingTrigger': 'addDefaultTrigger',
+  'orphanedNodes': 'connectOrphanedNodes',
+  'invalidConnections': 'fixInvalidConnections',
+  'circularDependency': 'breakCircularDependency',
+  'missingParameters': 'addDefaultParameters',
+  'invalidNodeType': 'replaceInvalidNodeType'
+});
+
+const NODE_TYPE_REGISTRY = Object.freeze({
+  'n8n-nodes-base.webhook': true,
+  'n8n-nodes-base.scheduleTrigger': true,
+  'n8n-nodes-base.manualTrigger': true,
+  'n8n-nodes-base.httpRequest': true,
+  'n8n-nodes-base.code': true,
+  'n8n-nodes-base.if': true,
+  'n8n-nodes-base.slack': true,
+  'n8n-nodes-base.gmail': true,
+  'n8n-nodes-base.googleSheets': true,
+  'n8n-nodes-base.trello': true,
+  'n8n-nodes-base.shopify': true,
+  'n8n-nodes-base.airtable': true,
+  'n8n-nodes-base.notion': true,
+  'n8n-nodes-base.github': true,
+  'n8n-nodes-base.telegram': true,
+  'n8n-nodes-base.discord': true,
+  'n8n-nodes-base.openAi': true,
+  'n8n-nodes-base.stripe': true,
+  'n8n-nodes-base.mongoDb': true,
+  'n8n-nodes-base.mySql': true
+});
 
 class ProactiveErrorPrevention {
   constructor() {
-    this.validationRules = {
-      // Critical validation rules that must always pass
-      critical: [
-        'mustHaveTrigger',
-        'noOrphanedNodes', 
-        'validConnections',
-        'noCircularDeps'
-      ],
-      // Warning rules that should be checked but not block generation
-      warnings: [
-        'nodeNaming',
-        'positionOverlap',
-        'parameterCompleteness'
-      ]
-    };
+    this.validationRules = VALIDATION_RULES;
 
-    this.autoFixStrategies = {
-      'missingTrigger': this.addDefaultTrigger.bind(this),
-      'orphanedNodes': this.connectOrphanedNodes.bind(this),
-      'invalidConnections': this.fixInvalidConnections.bind(this),
-      'circularDependency': this.breakCircularDependency.bind(this),
-      'missingParameters': this.addDefaultParameters.bind(this),
-      'invalidNodeType': this.replaceInvalidNodeType.bind(this)
-    };
+    // Bound lazily by getFixStrategy; most workflows never need a fix
+    this.autoFixStrategies = {};
 
     this.nodeTypeRegistry = this.buildNodeTypeRegistry();
   }
@@ -74,21 +123,23 @@ class ProactiveErrorPrevention {
         }
       }
 
-      // 3. Warning checks (non-blocking)
-      const warnings = [];
-      for (const rule of this.validationRules.warnings) {
-        const result = await this.runValidationRule(rule, workflow);
-        if (!result.isValid) {
-          warnings.push(...result.issues);
-        }
-      }
-
-      // 4. Post-fix validation
+      // 3. Post-fix validation
+      let warnings = [];
       if (fixes.length > 0) {
         const postValidation = await this.validateAndFixAnyWorkflow(workflow, { ...context, isRetry: true });
         if (postValidation.isValid) {
           console.log(`   ✅ All issues resolved after auto-fix`);
         }
+        // The revalidation already ran the warning rules on the fixed workflow
+        warnings = postValidation.warnings;
+      } else {
+        // 4. Warning checks (non-blocking)
+        for (const rule of this.validationRules.warnings) {
+          const result = await this.runValidationRule(rule, workflow);
+          if (!result.isValid) {
+            warnings.push(...result.issues);
+          }
+        }
       }
 
       return {
@@ -150,46 +201,18 @@ class ProactiveErrorPrevention {
    * Run individual validation rule
    */
   async runValidationRule(ruleName, workflow) {
-    switch (ruleName) {
-      case 'mustHaveTrigger':
-        return this.validateTriggerExists(workflow);
-      
-      case 'noOrphanedNodes':
-        return this.validateNoOrphanedNodes(workflow);
-      
-      case 'validConnections':
-        return this.validateConnections(workflow);
-      
-      case 'noCircularDeps':
-        return this.validateNoCircularDependencies(workflow);
-      
-      case 'nodeNaming':
-        return this.validateNodeNaming(workflow);
-      
-      case 'positionOverlap':
-        return this.validateNodePositions(workflow);
-      
-      case 'parameterCompleteness':
-        return this.validateParameters(workflow);
-      
-      default:
-        return { isValid: true, issues: [] };
+    if (!Object.hasOwn(VALIDATION_RULE_METHODS, ruleName)) {
+      return { isValid: true, issues: [] };
     }
+    return this[VALIDATION_RULE_METHODS[ruleName]](workflow);
   }
 
   /**
    * Validate trigger exists
    */
   validateTriggerExists(workflow) {
-    const triggerTypes = [
-      'n8n-nodes-base.webhook',
-      'n8n-nodes-base.scheduleTrigger',
-      'n8n-nodes-base.manualTrigger',
-      'n8n-nodes-base.rssFeedRead'
-    ];
-
     const triggers = workflow.nodes.filter(node => 
-      triggerTypes.includes(node.type)
+      ENTRY_POINT_TYPES.has(node.type)
     );
 
     if (triggers.length === 0) {
@@ -225,14 +248,8 @@ class ProactiveErrorPrevention {
       }
     });
 
-    const triggerTypes = [
-      'n8n-nodes-base.webhook',
-      'n8n-nodes-base.scheduleTrigger', 
-      'n8n-nodes-base.manualTrigger'
-    ];
-
     const orphanedNodes = workflow.nodes.filter(node => {
-      const isTrigger = triggerTypes.includes(node.type);
+      const isTrigger = TRIGGER_TYPES.has(node.type);
       return !isTrigger && !connectedNodes.has(node.name);
     });
 
@@ -297,8 +314,10 @@ class ProactiveErrorPrevention {
   validateNoCircularDependencies(workflow) {
     const visited = new Set();
     const recursionStack = new Set();
+    // Single shared DFS path; push/pop keeps it in sync with recursionStack
+    const path = [];
     
-    const hasCycle = (nodeName, path = []) => {
+    const hasCycle = (nodeName) => {
       if (recursionStack.has(nodeName)) {
         const cycleStart = path.indexOf(nodeName);
         return path.slice(cycleStart).concat([nodeName]);
@@ -314,7 +333,7 @@ class ProactiveErrorPrevention {
       if (nodeConnections && nodeConnections.main) {
         for (const connectionGroup of nodeConnections.main) {
           for (const connection of connectionGroup) {
-            const cycle = hasCycle(connection.node, [...path]);
+            const cycle = hasCycle(connection.node);
             if (cycle) return cycle;
           }
         }
@@ -424,7 +443,10 @@ class ProactiveErrorPrevention {
    * Get fix strategy for error type
    */
   getFixStrategy(errorType) {
-    return this.autoFixStrategies[errorType] || null;
+    if (!Object.hasOwn(AUTO_FIX_METHODS, errorType)) {
+      return null;
+    }
+    return this.autoFixStrategies[errorType] ||= this[AUTO_FIX_METHODS[errorType]].bind(this);
   }
 
   /**
@@ -444,7 +466,7 @@ class ProactiveErrorPrevention {
 
     // Connect to first non-trigger node
     const firstActionNode = workflow.nodes.find(node => 
-      !['n8n-nodes-base.webhook', 'n8n-nodes-base.scheduleTrigger', 'n8n-nodes-base.manualTrigger'].includes(node.type)
+      !TRIGGER_TYPES.has(node.type)
     );
 
     if (firstActionNode) {
@@ -471,7 +493,7 @@ class ProactiveErrorPrevention {
     const { orphanedNodes } = validationResult;
 
     const triggers = workflow.nodes.filter(node => 
-      ['n8n-nodes-base.webhook', 'n8n-nodes-base.scheduleTrigger', 'n8n-nodes-base.manualTrigger'].includes(node.type)
+      TRIGGER_TYPES.has(node.type)
     );
 
     if (triggers.length === 0) {
@@ -612,28 +634,7 @@ class ProactiveErrorPrevention {
    * Build node type registry
    */
   buildNodeTypeRegistry() {
-    return {
-      'n8n-nodes-base.webhook': true,
-      'n8n-nodes-base.scheduleTrigger': true,
-      'n8n-nodes-base.manualTrigger': true,
-      'n8n-nodes-base.httpRequest': true,
-      'n8n-nodes-base.code': true,
-      'n8n-nodes-base.if': true,
-      'n8n-nodes-base.slack': true,
-      'n8n-nodes-base.gmail': true,
-      'n8n-nodes-base.googleSheets': true,
-      'n8n-nodes-base.trello': true,
-      'n8n-nodes-base.shopify': true,
-      'n8n-nodes-base.airtable': true,
-      'n8n-nodes-base.notion': true,
-      'n8n-nodes-base.github': true,
-      'n8n-nodes-base.telegram': true,
-      'n8n-nodes-base.discord': true,
-      'n8n-nodes-base.openAi': true,
-      'n8n-nodes-base.stripe': true,
-      'n8n-nodes-base.mongoDb': true,
-      'n8n-nodes-base.mySql': true
-    };
+    return NODE_TYPE_REGISTRY;
   }
 
   /**
@@ -221,9 +221,6 @@ async function runProductionReadinessTest() {
         productionReadyCount++;
       }
     }
-    
-    // Small delay between tests
-    await new Promise(resolve => setTimeout(resolve, 200));
   }
   
   // Comprehensive Analysis
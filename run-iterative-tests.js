@@ -2,19 +2,36 @@
 const N8nIterativeTestRunner = require('./n8n-iterative-test-runner.js');
 const fs = require('fs');
 
+// Seed from the first CLI argument or N8N_TEST_SEED; otherwise pick one so the
+// run can still be reproduced from the printed value
+function resolveSeed() {
+  const rawSeed = process.argv[2] ?? process.env.N8N_TEST_SEED;
+  if (rawSeed === undefined) {
+    return Math.floor(Math.random() * 4294967296);
+  }
+  
+  const seed = Number(rawSeed);
+  if (!Number.isInteger(seed)) {
+    throw new Error(`Invalid seed: ${rawSeed}`);
+  }
+  return seed;
+}
+
 async function main() {
-  const runner = new N8nIterativeTestRunner();
+  const seed = resolveSeed();
+  const runner = new N8nIterativeTestRunner({ seed });
   
   console.log('🎯 n8n Iterative Test Runner');
   console.log('📋 Running 10,000 tests with issue identification and fixing');
-  console.log('🔄 Learning and improving with each test\n');
+  console.log('🔄 Learning and improving with each test');
+  console.log(`🎲 Seed: ${seed} (rerun with: node run-iterative-tests.js ${seed})\n`);
   
-  const startTime = Date.now();
+  const startTime = performance.now();
   
   try {
     const finalReport = await runner.runAllTests();
     
-    const endTime = Date.now();
+    const endTime = performance.now();
     const totalTime = endTime - startTime;
     
     console.log('\n' + '='.repeat(60));
@@ -29,10 +46,10 @@ async function main() {
     console.log(`   📈 Success Rate: ${finalReport.summary.successRate}%`);
     
     console.log('\n⏱️ PERFORMANCE:');
-    console.log(`   Total Execution Time: ${totalTime}ms (${(totalTime/1000).toFixed(2)}s)`);
+    console.log(`   Total Execution Time: ${totalTime.toFixed(0)}ms (${(totalTime/1000).toFixed(2)}s)`);
     console.log(`   Average Test Time: ${finalReport.performance.avgTestTime.toFixed(2)}ms`);
-    console.log(`   Fastest Test: #${finalReport.performance.fastestTest.id} (${finalReport.performance.fastestTest.time}ms)`);
-    console.log(`   Slowest Test: #${finalReport.performance.slowestTest.id} (${finalReport.performance.slowestTest.time}ms)`);
+    console.log(`   Fastest Test: #${finalReport.performance.fastestTest.id} (${finalReport.performance.fastestTest.time.toFixed(2)}ms)`);
+    console.log(`   Slowest Test: #${finalReport.performance.slowestTest.id} (${finalReport.performance.slowestTest.time.toFixed(2)}ms)`);
     
     console.log('\n🔍 ISSUES ANALYSIS:');
     console.log(`   Total Issues Found: ${finalReport.issues.totalFound}`);
@@ -59,6 +76,7 @@ async function main() {
     
     // Save detailed results to file
     const detailedResults = {
+      seed,
       executionTime: totalTime,
       timestamp: new Date().toISOString(),
       finalReport: finalReport,
@@ -6,29 +6,34 @@
 // Mock the API function
 const apiHandler = require('./api/index.js');
 
+// Invoke the handler in-process with a minimal response stub and return
+// the captured { statusCode, data } (or null if nothing was sent)
+async function callApi(req) {
+  let captured = null;
+  const res = {
+    setHeader: () => {},
+    status: (code) => ({
+      json: (data) => {
+        captured = { statusCode: code, data };
+        return captured;
+      }
+    })
+  };
+  
+  await apiHandler(req, res);
+  return captured;
+}
+
 async function testAPIEndpoint() {
   console.log('🧪 Testing API Endpoint Functionality');
   console.log('=' * 40);
   
   // Test health endpoint
   console.log('\n1. Testing Health Endpoint...');
-  const healthReq = {
+  const healthResponse = await callApi({
     method: 'GET',
     url: '/health'
-  };
-  
-  let healthResponse = null;
-  const healthRes = {
-    setHeader: () => {},
-    status: (code) => ({
-      json: (data) => {
-        healthResponse = { statusCode: code, data };
-        return healthResponse;
-      }
-    })
-  };
-  
-  await apiHandler(healthReq, healthRes);
+  });
   
   if (healthResponse && healthResponse.statusCode === 200) {
     console.log('   ✅ Health endpoint working');
@@ -77,19 +82,8 @@ async function testAPIEndpoint() {
       })
     };
     
-    let generateResponse = null;
-    const generateRes = {
-      setHeader: () => {},
-      status: (code) => ({
-        json: (data) => {
-          generateResponse = { statusCode: code, data };
-          return generateResponse;
-        }
-      })
-    };
-    
     try {
-      await apiHandler(generateReq, generateRes);
+      const generateResponse = await callApi(generateReq);
       
       if (generateResponse && generateResponse.statusCode === 200 && generateResponse.data.success) {
         console.log('   ✅ Generation successful');
@@ -135,9 +135,6 @@ const testPrompts = [
   }
 ];
 
-// Import the workflow generator function
-const generateAdvancedWorkflow = require('./api/index.js');
-
 async function testWorkflowGeneration(prompt) {
   console.log(`\n🧪 Testing: ${prompt.category}`);
   console.log(`📝 Description: ${prompt.description.substring(0, 80)}...`);
@@ -328,9 +325,6 @@ async function runAllTests() {
     if (result.success) {
       successCount++;
     }
-    
-    // Small delay between tests
-    await new Promise(resolve => setTimeout(resolve, 100));
   }
   
   // Summary
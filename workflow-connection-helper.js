@@ -4,6 +4,8 @@
  * Helps create properly connected workflows and prevents common issues
  */
 
+const fs = require('fs');
+
 class WorkflowConnectionHelper {
   constructor() {
     this.nodeRegistry = {
@@ -186,11 +188,11 @@ class WorkflowConnectionHelper {
   validateConnections(workflow) {
     const issues = [];
     const { nodes, connections } = workflow;
+    const nodeNames = new Set(nodes.map(n => n.name));
+    const triggerTypes = new Set(Object.values(this.nodeRegistry.triggers).map(t => t.type));
     
     // Check for triggers
-    const triggers = nodes.filter(node => 
-      Object.values(this.nodeRegistry.triggers).some(t => t.type === node.type)
-    );
+    const triggers = nodes.filter(node => triggerTypes.has(node.type));
     
     if (triggers.length === 0) {
       issues.push('Workflow must have at least one trigger node');
@@ -198,7 +200,7 @@ class WorkflowConnectionHelper {
 
     // Check all connections reference existing nodes
     for (const [sourceName, nodeConnections] of Object.entries(connections)) {
-      if (!nodes.some(n => n.name === sourceName)) {
+      if (!nodeNames.has(sourceName)) {
         issues.push(`Connection source '${sourceName}' does not exist`);
         continue;
       }
@@ -206,7 +208,7 @@ class WorkflowConnectionHelper {
       if (nodeConnections.main) {
         for (const connectionGroup of nodeConnections.main) {
           for (const connection of connectionGroup) {
-            if (!nodes.some(n => n.name === connection.node)) {
+            if (!nodeNames.has(connection.node)) {
               issues.push(`Connection target '${connection.node}' does not exist`);
             }
           }
@@ -226,10 +228,9 @@ class WorkflowConnectionHelper {
       }
     });
 
-    const unconnectedNodes = nodes.filter(node => {
-      const isTrigger = Object.values(this.nodeRegistry.triggers).some(t => t.type === node.type);
-      return !isTrigger && !connectedNodes.has(node.name);
-    });
+    const unconnectedNodes = nodes.filter(node =>
+      !triggerTypes.has(node.type) && !connectedNodes.has(node.name)
+    );
 
     if (unconnectedNodes.length > 0) {
       issues.push(`Unconnected nodes: ${unconnectedNodes.map(n => n.name).join(', ')}`);
@@ -302,7 +303,6 @@ class WorkflowConnectionHelper {
    * Export workflow to JSON file
    */
   exportWorkflow(workflow, filename) {
-    const fs = require('fs');
     const json = JSON.stringify(workflow, null, 2);
     fs.writeFileSync(filename, json);
     console.log(`✅ Workflow exported to: ${filename}`);